@@ -16,22 +16,48 @@
 # You should have received a copy of the GNU General Public License
 # along with BlenderBIM Add-on.  If not, see <http://www.gnu.org/licenses/>.
 
+import re
 import isodate
 from dateutil import parser
 import ifcopenshell.util.date
-from datetime import timedelta
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
+from typing import Union, Optional
 
+_SECS_PER_DAY = 86400
+_SECS_PER_YEAR_APPROX = 365 * _SECS_PER_DAY
+_SECS_PER_MONTH_APPROX = 30 * _SECS_PER_DAY
+_SECS_PER_WORKDAY = 8 * 3600
 
+_get_days_and_seconds = attrgetter("days", "seconds")
+_get_years_and_months = attrgetter("years", "months")
+
+# durations with every component given, e.g. P0Y0M3DT4H0M0S
+_FULL_DURATION_RE = re.compile(r"^P(\d+)Y(\d+)M(\d+)DT(\d+)H(\d+)M(\d+)S$")
+
+
+def purge():
+    parse_datetime.cache_clear()
+    parse_duration.cache_clear()
+
+
+@lru_cache(maxsize=4096)
 def parse_datetime(value):
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
     try:
         return parser.isoparse(value)
-    except:
+    except ValueError:
         try:
             return parser.parse(value, dayfirst=True, fuzzy=True)
-        except:
+        except (ValueError, OverflowError):
             return None
 
 
+@lru_cache(maxsize=4096)
 def parse_duration(value):
     return ifcopenshell.util.date.parse_duration(value)
 
@@ -39,20 +65,31 @@ def parse_duration(value):
 def canonicalise_time(time):
     if not time:
         return "-"
-    return time.strftime("%d/%m/%y")
+    return f"{time.day:02d}/{time.month:02d}/{time.year % 100:02d}"
+
+
+# Fully specified durations skip ifc2datetime
+def _parse_ifc_duration(value):
+    if match := _FULL_DURATION_RE.match(value):
+        years, months, days, hours, minutes, seconds = map(int, match.groups())
+        return isodate.Duration(years=years, months=months, days=days, hours=hours, minutes=minutes, seconds=seconds)
+    return ifcopenshell.util.date.ifc2datetime(value)
 
 
-def parse_duration_as_blender_props(dt, simplify=True):
+def parse_duration_as_blender_props(
+    dt: Union[str, timedelta, isodate.Duration, None], simplify: bool = True
+) -> Optional[dict[str, int]]:
     if simplify:
         if isinstance(dt, str):
-            dt = ifcopenshell.util.date.ifc2datetime(dt)
+            dt = _parse_ifc_duration(dt)
 
-        seconds = getattr(dt, "seconds", 0)
+        days, seconds = _get_days_and_seconds(dt) if dt is not None else (0, 0)
         hours, seconds = divmod(seconds, 3600)
         minutes, seconds = divmod(seconds, 60)
-        days = getattr(dt, "days", 0)
-        months = int(getattr(dt, "months", 0))
-        years = int(getattr(dt, "years", 0))
+        if isinstance(dt, isodate.Duration):
+            years, months = map(int, _get_years_and_months(dt))
+        else:
+            years = months = 0
         return {
             "years": years,
             "months": months,
@@ -63,6 +100,20 @@ def parse_duration_as_blender_props(dt, simplify=True):
         }
 
 
+# Approximates 365 day years and 30 day months
+def _normalise_duration(total_days, seconds_left, years=0, months=0):
+    extra_years, days = divmod(total_days, 365)
+    extra_months = days // 30
+    years += extra_years
+    months += extra_months
+    if months >= 12:
+        extra_years, months = divmod(months, 12)
+        years += extra_years
+    hours, seconds = divmod(seconds_left, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return years, months, hours, minutes, seconds
+
+
 def blender_props_to_iso_duration(durations_attributes, duration_type, prop_name):
     duration_props = None
     for collection in durations_attributes:
@@ -70,50 +121,36 @@ def blender_props_to_iso_duration(durations_attributes, duration_type, prop_name
             duration_props = collection
             break
     if duration_props and not duration_type or duration_type == "ELAPSEDTIME":
-        duration_string = "P{}Y{}M{}DT{}H{}M{}S".format(
-            duration_props.years if duration_props.years else 0,
-            duration_props.months if duration_props.months else 0,
-            duration_props.days if duration_props.days else 0,
-            duration_props.hours if duration_props.hours else 0,
-            duration_props.minutes if duration_props.minutes else 0,
-            duration_props.seconds if duration_props.seconds else 0,
+        duration_object = isodate.Duration(
+            years=duration_props.years,
+            months=duration_props.months,
+            days=duration_props.days,
+            hours=duration_props.hours,
+            minutes=duration_props.minutes,
+            seconds=duration_props.seconds,
         )
-        duration_object = ifcopenshell.util.date.ifc2datetime(duration_string)
     elif duration_props and duration_type == "WORKTIME":
-        years = (duration_props.years * 365 * 24 * 60 * 60) if duration_props.years else 0
-        months = (duration_props.months * 30 * 24 * 60 * 60) if duration_props.months else 0
-        days = (duration_props.days * 24 * 60 * 60) if duration_props.days else 0
-        days_subtotal = (years + months + days) / (24 * 60 * 60)
+        years = duration_props.years * _SECS_PER_YEAR_APPROX
+        months = duration_props.months * _SECS_PER_MONTH_APPROX
+        days = duration_props.days * _SECS_PER_DAY
+        days_subtotal = (years + months + days) / _SECS_PER_DAY
 
-        hours = (duration_props.hours * 60 * 60) if duration_props.hours else 0
-        minutes = (duration_props.minutes * 60) if duration_props.minutes else 0
-        seconds = duration_props.seconds if duration_props.seconds else 0
-        total_seconds = hours + minutes + seconds
+        total_seconds = duration_props.hours * 3600 + duration_props.minutes * 60 + duration_props.seconds
 
         # TODO: implement actual calendar worktime
-        calendar_seconds_per_day = 8 * 60 * 60
-        extra_days, seconds_left = divmod(total_seconds, calendar_seconds_per_day)
+        extra_days, seconds_left = divmod(total_seconds, _SECS_PER_WORKDAY)
         total_days = days_subtotal + extra_days
         duration_object = timedelta(days=total_days, seconds=seconds_left)
     else:
         return None
     if duration_object:
         total_days = int(duration_object.days)
-        seconds_left = int(duration_object.seconds)
-        years, days = divmod(total_days, 365)
-        if hasattr(duration_object, "years"):
-            years += duration_object.years
-
-        months, days = divmod(days, 30)
-        if hasattr(duration_object, "months"):
-            months += duration_object.months
-
-        if months >= 12:
-            extra_years, months = divmod(months, 12)
-            years += extra_years
-
-        hours, seconds = divmod(seconds_left, 3600)
-        minutes, seconds = divmod(seconds, 60)
+        years, months, hours, minutes, seconds = _normalise_duration(
+            total_days,
+            int(duration_object.seconds),
+            getattr(duration_object, "years", 0),
+            getattr(duration_object, "months", 0),
+        )
         if years > 0 or months > 0 or total_days > 0 or hours > 0 or minutes > 0 or seconds > 0:
             duration_string = "P"
             duration_string += "{}Y".format(int(years)) if years > 0 else ""
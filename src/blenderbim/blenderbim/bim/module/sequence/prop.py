@@ -25,6 +25,7 @@ import blenderbim.tool as tool
 import blenderbim.core.sequence as core
 from blenderbim.bim.ifc import IfcStore
 from blenderbim.bim.module.sequence.data import SequenceData, AnimationColorSchemeData, refresh as refresh_sequence_data
+import blenderbim.bim.module.sequence.helper as helper
 import blenderbim.bim.module.resource.data
 import blenderbim.bim.module.pset.data
 from blenderbim.bim.prop import StrProperty, Attribute
@@ -50,6 +51,7 @@ def purge():
     global tasktimecolumns_enum
     taskcolumns_enum = []
     tasktimecolumns_enum = []
+    helper.purge()
 
 
 def getTaskColumns(self, context):
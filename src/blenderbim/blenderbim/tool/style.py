@@ -24,8 +24,9 @@ import ifcopenshell.util.representation
 import blenderbim.core.tool
 import blenderbim.tool as tool
 import blenderbim.bim.helper
-from mathutils import Color
-from typing import Union, Any, Optional, Literal, assert_never
+from collections import defaultdict
+from functools import partial
+from typing import Union, Any, Optional, Literal, Callable, assert_never
 
 # fmt: off
 TEXTURE_MAPS_BY_METHODS = {
@@ -43,10 +44,99 @@ STYLE_PROPS_MAP = {
     "specular_colour": "SpecularColour",
 }
 
+# (blender prop, ifc attribute, class prop, ratio prop, null prop, is colour) for each STYLE_PROPS_MAP item
+# *_colour props are colour FloatVectorProperties and return mathutils.Color
+STYLE_PROPS_NAMES = tuple(
+    (
+        prop_blender,
+        prop_ifc,
+        f"{prop_blender}_class",
+        f"{prop_blender}_ratio",
+        f"is_{prop_blender}_null",
+        prop_blender.endswith("_colour"),
+    )
+    for prop_blender, prop_ifc in STYLE_PROPS_MAP.items()
+)
+
 STYLE_TYPES = Literal["Shading", "External"]
 
+# verbose report colours
+_GREEN = "\033[32m"
+_BLUE = "\033[1;34m"
+_RESET = "\033[0m"
+
+
+def _color_to_ifc_format(color) -> dict[str, Any]:
+    red, green, blue = color[:3]
+    return {"Name": None, "Red": red, "Green": green, "Blue": blue}
+
+
+def _get_principled_bsdf_attributes(bsdf: bpy.types.Node, attributes: dict[str, Any], report: Callable) -> Any:
+    report(f"Because of {_BLUE}BSDF_PRINCIPLED{_RESET} node reflectance method identified as {_BLUE}PHYSICAL{_RESET}")
+    attributes["ReflectanceMethod"] = "NOTDEFINED" if tool.Ifc.get_schema() != "IFC4X3" else "PHYSICAL"
+
+    report(f"BSDF {_GREEN}Base Color{_RESET} saved as {_GREEN}DiffuseColour{_RESET}")
+    diffuse_color = bsdf.inputs["Base Color"].default_value
+
+    report(f"BSDF {_GREEN}Metallic{_RESET} saved as {_GREEN}SpecularColour{_RESET}")
+    attributes["SpecularColour"] = round(bsdf.inputs["Metallic"].default_value, 3)
+
+    report(f"BSDF {_GREEN}Roughness{_RESET} saved as {_GREEN}IfcSpecularRoughness{_RESET}")
+    attributes["SpecularHighlight"] = {"IfcSpecularRoughness": round(bsdf.inputs["Roughness"].default_value, 3)}
+
+    report(f"BSDF {_GREEN}Alpha{_RESET} saved as {_GREEN}Transparency{_RESET}")
+    attributes["Transparency"] = 1 - bsdf.inputs["Alpha"].default_value
+    return diffuse_color
+
+
+def _get_rough_bsdf_attributes(
+    reflectance_method: str, bsdf: bpy.types.Node, attributes: dict[str, Any], report: Callable
+) -> Any:
+    report(
+        f"Because of {_BLUE}{bsdf.type}{_RESET} node reflectance method identified as {_BLUE}{reflectance_method}{_RESET}"
+    )
+    attributes["ReflectanceMethod"] = reflectance_method
+
+    report(f"BSDF {_GREEN}Roughness{_RESET} saved as {_GREEN}IfcSpecularRoughness{_RESET}")
+    attributes["SpecularHighlight"] = {"IfcSpecularRoughness": round(bsdf.inputs["Roughness"].default_value, 3)}
+
+    report(f"BSDF {_GREEN}Color{_RESET} saved as {_GREEN}DiffuseColour{_RESET}")
+    return bsdf.inputs["Color"].default_value
+
+
+def _get_emission_attributes(bsdf: bpy.types.Node, attributes: dict[str, Any], report: Callable) -> Any:
+    report(f"Because of {_BLUE}EMISSION{_RESET} node reflectance method identified as {_BLUE}FLAT{_RESET}")
+    attributes["ReflectanceMethod"] = "FLAT"
+    attributes["SpecularHighlight"] = None
+
+    report(f"BSDF {_GREEN}Color{_RESET} saved as {_GREEN}DiffuseColour{_RESET}")
+    return bsdf.inputs["Color"].default_value
+
+
+# Fills rendering attributes from a bsdf node and returns its diffuse colour.
+# If a material has several linked bsdfs, the first type in this order is used.
+BSDF_HANDLERS: dict[str, Callable[[bpy.types.Node, dict[str, Any], Callable], Any]] = {
+    "BSDF_GLOSSY": partial(_get_rough_bsdf_attributes, "METAL"),
+    "BSDF_DIFFUSE": partial(_get_rough_bsdf_attributes, "MATT"),
+    "BSDF_GLASS": partial(_get_rough_bsdf_attributes, "GLASS"),
+    # TODO: remove?
+    "EMISSION": _get_emission_attributes,
+    # TODO: remove?
+    "BSDF_PRINCIPLED": _get_principled_bsdf_attributes,
+}
+
 
 class Style(blenderbim.core.tool.Style):
+    _RNA_KEYS_CACHE: dict[type, frozenset[str]] = {}
+
+    @classmethod
+    def _get_rna_property_names(cls, props: bpy.types.PropertyGroup) -> frozenset[str]:
+        """Return names of RNA properties available on `props`, cached per property group type."""
+        props_type = type(props)
+        if (names := cls._RNA_KEYS_CACHE.get(props_type)) is None:
+            names = cls._RNA_KEYS_CACHE[props_type] = frozenset(props.bl_rna.properties.keys())
+        return names
+
     @classmethod
     def can_support_rendering_style(cls, obj: bpy.types.Material) -> bool:
         return obj.use_nodes and hasattr(obj.node_tree, "nodes")
@@ -130,10 +220,7 @@ class Style(blenderbim.core.tool.Style):
             style = tool.Ifc.get().by_id(ifc_definition_id)
         else:
             style = blender_material_or_style
-        style_elements = {}
-        for style in style.Styles:
-            style_elements[style.is_a()] = style
-        return style_elements
+        return {surface_style.is_a(): surface_style for surface_style in style.Styles}
 
     @classmethod
     def get_shading_style_data_from_props(cls) -> dict[str, Any]:
@@ -142,22 +229,19 @@ class Style(blenderbim.core.tool.Style):
         surface_style_data = dict()
         props = bpy.context.scene.BIMStylesProperties
 
-        available_props = props.bl_rna.properties.keys()
-        for prop_blender, prop_ifc in STYLE_PROPS_MAP.items():
-            class_prop_name = f"{prop_blender}_class"
-
+        available_props = cls._get_rna_property_names(props)
+        for prop_blender, prop_ifc, class_prop_name, ratio_prop_name, _, is_colour in STYLE_PROPS_NAMES:
             # get detailed color properties if available
             if class_prop_name in available_props:
                 prop_class = getattr(props, class_prop_name)
                 if prop_class == "IfcColourRgb":
                     prop_value = tuple(getattr(props, prop_blender))
                 else:  # IfcNormalisedRatioMeasure
-                    ratio_prop_name = f"{prop_blender}_ratio"
                     prop_value = getattr(props, ratio_prop_name)
                 prop_value = (prop_class, prop_value)
             else:
                 prop_value = getattr(props, prop_blender)
-                if isinstance(prop_value, Color):
+                if is_colour:
                     prop_value = tuple(prop_value)
 
             surface_style_data[prop_ifc] = prop_value
@@ -206,27 +290,24 @@ class Style(blenderbim.core.tool.Style):
                 prop_value = tool.Blender.get_blender_prop_default_value(props, prop_blender)
             setattr(props, prop_blender, prop_value)
 
-        available_props = props.bl_rna.properties.keys()
+        available_props = cls._get_rna_property_names(props)
         # fallback value for reflectance method
         if style_data.get("ReflectanceMethod", None) is None:
             style_data["ReflectanceMethod"] = "NOTDEFINED"
-        for prop_blender, prop_ifc in STYLE_PROPS_MAP.items():
+        for prop_blender, prop_ifc, class_prop_name, ratio_prop_name, null_prop_name, _ in STYLE_PROPS_NAMES:
             prop_value = style_data.get(prop_ifc, None)
             is_null = prop_value is None
 
             # set null property if available
-            null_prop_name = f"is_{prop_blender}_null"
             if null_prop_name in available_props:
                 set_prop(null_prop_name, is_null)
 
             # set detailed color properties if available
-            class_prop_name = f"{prop_blender}_class"
             if class_prop_name in available_props:
                 prop_class, prop_value = prop_value or (None, None)
                 # set class enum
                 set_prop(class_prop_name, prop_class)
                 # set prop value
-                ratio_prop_name = f"{prop_blender}_ratio"
                 if prop_class == "IfcColourRgb":
                     set_prop(prop_blender, prop_value)
                     set_prop(ratio_prop_name, None)
@@ -254,14 +335,6 @@ class Style(blenderbim.core.tool.Style):
     def get_surface_rendering_attributes(cls, obj: bpy.types.Material, verbose: bool = False) -> dict[str, Any]:
         report = (lambda *x: print(*x)) if verbose else (lambda *x: None)
 
-        def color_to_ifc_format(color):
-            return {
-                "Name": None,
-                "Red": color[0],
-                "Green": color[1],
-                "Blue": color[2],
-            }
-
         def get_input_node(node, input_name=None, of_type=None, input_index=None):
             input_pin = node.inputs[input_name] if input_index is None else node.inputs[input_index]
             if of_type:
@@ -269,27 +342,26 @@ class Style(blenderbim.core.tool.Style):
             return next((l.from_node for l in input_pin.links), None)
 
         props = obj.BIMStyleProperties
-        transparency = 1 - obj.diffuse_color[3]
-        diffuse_color = obj.diffuse_color
-        viewport_color = color_to_ifc_format(obj.diffuse_color)
+        # used if MIX_SHADER setup isn't recognised
+        diffuse_color = tuple(obj.diffuse_color)
+        viewport_color = _color_to_ifc_format(diffuse_color)
         attributes = {
             "SurfaceColour": viewport_color,
-            "Transparency": transparency,
+            "Transparency": 1 - diffuse_color[3],
         }
-        GREEN = "\033[32m"
-        BLUE = "\033[1;34m"
-        R = "\033[0m"  # RESET symbol
-
         report("--------------------")
         report("Verbose method of getting surface rendering attributes enabled.")
         report("If some attribute is not mentioned below, then it won't be saved to IFC.")
         report("--------------------")
-        report(f"{GREEN}Viewport color{R} saved as {GREEN}SurfaceColour{R}")
+        report(f"{_GREEN}Viewport color{_RESET} saved as {_GREEN}SurfaceColour{_RESET}")
 
         # TODO: make sure bsdf is connected to the output?
-        bsdfs = {n.type: n for n in obj.node_tree.nodes if n.outputs and n.outputs[0].is_linked}
+        bsdfs = {}
+        for node in obj.node_tree.nodes:
+            if (node_type := node.type) in BSDF_HANDLERS and node.outputs and node.outputs[0].is_linked:
+                bsdfs[node_type] = node
         if "BSDF_PRINCIPLED" not in bsdfs:
-            report(f"{GREEN}Viewport color alpha{R} saved as {GREEN}Transparency{R}")
+            report(f"{_GREEN}Viewport color alpha{_RESET} saved as {_GREEN}Transparency{_RESET}")
 
         # TODO: should escape referring to pins by their name to support different languages
         material_output = tool.Blender.get_material_node(obj, "OUTPUT_MATERIAL", {"is_active_output": True})
@@ -304,16 +376,16 @@ class Style(blenderbim.core.tool.Style):
                 and second_input_node.type in ("RGB", "TEX_IMAGE")
             ):
                 report(
-                    f"Because of {BLUE}MIX_SHADER + LIGHT_PATH + BSDF_TRANSPARENT + RGB/TEX{R} node setup reflectance method identified as {BLUE}FLAT{R}"
+                    f"Because of {_BLUE}MIX_SHADER + LIGHT_PATH + BSDF_TRANSPARENT + RGB/TEX{_RESET} node setup reflectance method identified as {_BLUE}FLAT{_RESET}"
                 )
                 attributes["ReflectanceMethod"] = "FLAT"
                 attributes["SpecularHighlight"] = None
 
                 if second_input_node.type == "RGB":
-                    report(f"RGB {GREEN}Color{R} saved as {GREEN}DiffuseColour{R}")
+                    report(f"RGB {_GREEN}Color{_RESET} saved as {_GREEN}DiffuseColour{_RESET}")
                     diffuse_color = second_input_node.outputs[0].default_value
                 elif second_input_node.type == "TEX_IMAGE":
-                    report(f"{GREEN}BBIM Panel Diffuse Color{R} saved as {GREEN}DiffuseColour{R}")
+                    report(f"{_GREEN}BBIM Panel Diffuse Color{_RESET} saved as {_GREEN}DiffuseColour{_RESET}")
                     diffuse_color = props.diffuse_color
 
         elif surface_output and (
@@ -323,93 +395,21 @@ class Style(blenderbim.core.tool.Style):
                 and (bsdf := get_input_node(surface_output, input_index=1, of_type="BSDF_PRINCIPLED"))
             )
         ):
-            report(f"Because of {BLUE}BSDF_PRINCIPLED{R} node reflectance method identified as {BLUE}PHYSICAL{R}")
-            attributes["ReflectanceMethod"] = "NOTDEFINED" if tool.Ifc.get_schema() != "IFC4X3" else "PHYSICAL"
-
-            report(f"BSDF {GREEN}Base Color{R} saved as {GREEN}DiffuseColour{R}")
-            diffuse_color = bsdf.inputs["Base Color"].default_value
-
-            report(f"BSDF {GREEN}Metallic{R} saved as {GREEN}SpecularColour{R}")
-            attributes["SpecularColour"] = round(bsdf.inputs["Metallic"].default_value, 3)
+            diffuse_color = _get_principled_bsdf_attributes(bsdf, attributes, report)
 
-            report(f"BSDF {GREEN}Roughness{R} saved as {GREEN}IfcSpecularRoughness{R}")
-            attributes["SpecularHighlight"] = {"IfcSpecularRoughness": round(bsdf.inputs["Roughness"].default_value, 3)}
-
-            report(f"BSDF {GREEN}Alpha{R} saved as {GREEN}Transparency{R}")
-            attributes["Transparency"] = 1 - bsdf.inputs["Alpha"].default_value
-
-        elif "BSDF_GLOSSY" in bsdfs:
-            attributes["ReflectanceMethod"] = "METAL"
-            report(f"Because of {BLUE}BSDF_GLOSSY{R} node reflectance method identified as {BLUE}METAL{R}")
-            bsdf = bsdfs["BSDF_GLOSSY"]
-
-            report(f"BSDF {GREEN}Roughness{R} saved as {GREEN}IfcSpecularRoughness{R}")
-            attributes["SpecularHighlight"] = {"IfcSpecularRoughness": round(bsdf.inputs["Roughness"].default_value, 3)}
-
-            report(f"BSDF {GREEN}Color{R} saved as {GREEN}DiffuseColour{R}")
-            diffuse_color = bsdf.inputs["Color"].default_value
-
-        elif "BSDF_DIFFUSE" in bsdfs:
-            report(f"Because of {BLUE}BSDF_DIFFUSE{R} node reflectance method identified as {BLUE}MATT{R}")
-            attributes["ReflectanceMethod"] = "MATT"
-            bsdf = bsdfs["BSDF_DIFFUSE"]
-
-            report(f"BSDF {GREEN}Roughness{R} saved as {GREEN}IfcSpecularRoughness{R}")
-            attributes["SpecularHighlight"] = {"IfcSpecularRoughness": round(bsdf.inputs["Roughness"].default_value, 3)}
-
-            report(f"BSDF {GREEN}Color{R} saved as {GREEN}DiffuseColour{R}")
-            diffuse_color = bsdf.inputs["Color"].default_value
-
-        elif "BSDF_GLASS" in bsdfs:
-            report(f"Because of {BLUE}BSDF_GLASS{R} node reflectance method identified as {BLUE}GLASS{R}")
-            attributes["ReflectanceMethod"] = "GLASS"
-            bsdf = bsdfs["BSDF_GLASS"]
-
-            report(f"BSDF {GREEN}Roughness{R} saved as {GREEN}IfcSpecularRoughness{R}")
-            attributes["SpecularHighlight"] = {"IfcSpecularRoughness": round(bsdf.inputs["Roughness"].default_value, 3)}
-
-            report(f"BSDF {GREEN}Color{R} saved as {GREEN}DiffuseColour{R}")
-            diffuse_color = bsdf.inputs["Color"].default_value
-
-        # TODO: remove?
-        elif "EMISSION" in bsdfs:
-            report(f"Because of {BLUE}EMISSION{R} node reflectance method identified as {BLUE}FLAT{R}")
-            attributes["ReflectanceMethod"] = "FLAT"
-            bsdf = bsdfs["EMISSION"]
-
-            attributes["SpecularHighlight"] = None
-            report(f"BSDF {GREEN}Color{R} saved as {GREEN}DiffuseColour{R}")
-
-            diffuse_color = bsdf.inputs["Color"].default_value
-
-        # TODO: remove?
-        elif "BSDF_PRINCIPLED" in bsdfs:
-            report(f"Because of {BLUE}BSDF_PRINCIPLED{R} node reflectance method identified as {BLUE}PHYSICAL{R}")
-            attributes["ReflectanceMethod"] = "NOTDEFINED" if tool.Ifc.get_schema() != "IFC4X3" else "PHYSICAL"
-            bsdf = bsdfs["BSDF_PRINCIPLED"]
-
-            report(f"BSDF {GREEN}Base Color{R} saved as {GREEN}DiffuseColour{R}")
-            diffuse_color = bsdf.inputs["Base Color"].default_value
-
-            report(f"BSDF {GREEN}Metallic{R} saved as {GREEN}SpecularColour{R}")
-            attributes["SpecularColour"] = round(bsdf.inputs["Metallic"].default_value, 3)
-
-            report(f"BSDF {GREEN}Roughness{R} saved as {GREEN}IfcSpecularRoughness{R}")
-            attributes["SpecularHighlight"] = {"IfcSpecularRoughness": round(bsdf.inputs["Roughness"].default_value, 3)}
-
-            report(f"BSDF {GREEN}Alpha{R} saved as {GREEN}Transparency{R}")
-            attributes["Transparency"] = 1 - bsdf.inputs["Alpha"].default_value
+        elif bsdf_type := next((t for t in BSDF_HANDLERS if t in bsdfs), None):
+            diffuse_color = BSDF_HANDLERS[bsdf_type](bsdfs[bsdf_type], attributes, report)
 
         else:
-            report(f"No supported bsdfs found - reflectance method identified as {BLUE}NOTDEFINED{R}")
+            report(f"No supported bsdfs found - reflectance method identified as {_BLUE}NOTDEFINED{_RESET}")
             attributes["ReflectanceMethod"] = "NOTDEFINED"
 
             attributes["SpecularHighlight"] = None
-            report(f"{GREEN}Viewport color{R} saved as {GREEN}DiffuseColour{R}")
+            report(f"{_GREEN}Viewport color{_RESET} saved as {_GREEN}DiffuseColour{_RESET}")
             attributes["DiffuseColour"] = viewport_color
             return attributes
 
-        attributes["DiffuseColour"] = color_to_ifc_format(diffuse_color)
+        attributes["DiffuseColour"] = _color_to_ifc_format(diffuse_color)
         return attributes
 
     @classmethod
@@ -429,14 +429,10 @@ class Style(blenderbim.core.tool.Style):
 
     @classmethod
     def get_surface_shading_attributes(cls, obj: bpy.types.Material) -> dict[str, Any]:
+        diffuse_color = tuple(obj.diffuse_color)
         data = {
-            "SurfaceColour": {
-                "Name": None,
-                "Red": obj.diffuse_color[0],
-                "Green": obj.diffuse_color[1],
-                "Blue": obj.diffuse_color[2],
-            },
-            "Transparency": 1 - obj.diffuse_color[3],
+            "SurfaceColour": _color_to_ifc_format(diffuse_color),
+            "Transparency": 1 - diffuse_color[3],
         }
         if tool.Ifc.get_schema() == "IFC2X3":
             del data["Transparency"]
@@ -483,12 +479,58 @@ class Style(blenderbim.core.tool.Style):
         elif style_type == "IfcSurfaceStyleLighting":
             return props.lighting_style_colours
 
+    @classmethod
+    def _get_elements_by_styles(
+        cls, ifc_file: ifcopenshell.file, style_ids: set[int]
+    ) -> dict[int, set[ifcopenshell.entity_instance]]:
+        """Get elements using each of the given styles, keyed by style id.
+
+        Same results as `ifcopenshell.util.element.get_elements_by_style` for each style,
+        but computed in a single pass over styled items.
+        """
+        elements_by_style: dict[int, set[ifcopenshell.entity_instance]] = defaultdict(set)
+        if not style_ids:
+            return elements_by_style
+        for styled_item in ifc_file.by_type("IfcStyledItem"):
+            styles = []
+            for style in styled_item.Styles:
+                if style.is_a("IfcPresentationStyleAssignment"):
+                    styles.extend(substyle for substyle in style.Styles if substyle.id() in style_ids)
+                elif style.id() in style_ids:
+                    styles.append(style)
+            if not styles:
+                continue
+
+            elements = set()
+            if styled_item.Item:
+                for representation in ifc_file.get_inverse(styled_item.Item):
+                    if representation.is_a("IfcShapeRepresentation"):
+                        elements.update(
+                            ifcopenshell.util.element.get_elements_by_representation(ifc_file, representation)
+                        )
+            else:
+                for styled_rep in ifc_file.get_inverse(styled_item):
+                    if not styled_rep.is_a("IfcStyledRepresentation"):
+                        continue
+                    for material_def_rep in styled_rep.OfProductRepresentation:
+                        elements.update(
+                            ifcopenshell.util.element.get_elements_by_material(
+                                ifc_file, material_def_rep.RepresentedMaterial
+                            )
+                        )
+
+            for style in styles:
+                elements_by_style[style.id()].update(elements)
+        return elements_by_style
+
     @classmethod
     def import_presentation_styles(cls, style_type: str) -> None:
         color_to_tuple = lambda x: (x.Red, x.Green, x.Blue)
         props = bpy.context.scene.BIMStylesProperties
         props.styles.clear()
-        styles = sorted(tool.Ifc.get().by_type(style_type), key=lambda x: x.Name or "Unnamed")
+        ifc_file = tool.Ifc.get()
+        styles = sorted(ifc_file.by_type(style_type), key=lambda x: x.Name or "Unnamed")
+        elements_by_style = cls._get_elements_by_styles(ifc_file, {style.id() for style in styles})
         for style in styles:
             new = props.styles.add()
             new.ifc_definition_id = style.id()
@@ -504,7 +546,7 @@ class Style(blenderbim.core.tool.Style):
                     if surface_style.DiffuseColour and surface_style.DiffuseColour.is_a("IfcColourRgb"):
                         new.has_diffuse_colour = True
                         new.diffuse_colour = color_to_tuple(surface_style.DiffuseColour)
-            new.total_elements = len(ifcopenshell.util.element.get_elements_by_style(tool.Ifc.get(), style))
+            new.total_elements = len(elements_by_style.get(style.id(), ()))
 
     @classmethod
     def import_surface_attributes(cls, style: ifcopenshell.entity_instance) -> None:
@@ -515,7 +557,7 @@ class Style(blenderbim.core.tool.Style):
     @classmethod
     def has_blender_external_style(cls, style_elements: dict[str, ifcopenshell.entity_instance]) -> bool:
         external_style = style_elements.get("IfcExternallyDefinedSurfaceStyle", None)
-        return bool(external_style and external_style.Location and external_style.Location.endswith(".blend"))
+        return bool(external_style and (external_style.Location or "").endswith(".blend"))
 
     @classmethod
     def is_editing_styles(cls) -> bool:
@@ -544,7 +586,8 @@ class Style(blenderbim.core.tool.Style):
                 inverses.extend(ifc_file.get_inverse(inverse))
                 continue
 
-            if not (item := inverse.Item):
+            # e.g. IfcPresentationLayerWithStyle also references styles
+            if not inverse.is_a("IfcStyledItem") or not (item := inverse.Item):
                 continue
 
             if item.is_a("IfcMappedItem"):
@@ -134,6 +134,26 @@ class TestGetStyle(NewFile):
         assert subject.get_style(obj) == None
 
 
+class TestGetStyledItems(NewFile):
+    def test_run(self):
+        ifc = ifcopenshell.file()
+        tool.Ifc.set(ifc)
+        style = ifc.createIfcSurfaceStyle()
+        item = ifc.createIfcExtrudedAreaSolid()
+        ifc.createIfcStyledItem(Item=item, Styles=[style])
+        assert subject.get_styled_items(style) == [item]
+
+    def test_ignoring_presentation_layers_with_style(self):
+        ifc = ifcopenshell.file()
+        tool.Ifc.set(ifc)
+        style = ifc.createIfcSurfaceStyle()
+        item = ifc.createIfcExtrudedAreaSolid()
+        ifc.createIfcStyledItem(Item=item, Styles=[style])
+        layer_item = ifc.createIfcExtrudedAreaSolid()
+        ifc.createIfcPresentationLayerWithStyle(Name="Layer", AssignedItems=[layer_item], LayerStyles=[style])
+        assert subject.get_styled_items(style) == [item]
+
+
 class TestGetSurfaceRenderingAttributes(NewFile):
     def test_get_different_surface_and_diffuse_colours_from_a_principled_bsdf(self):
         obj = bpy.data.materials.new("Material")
@@ -456,6 +476,47 @@ class TestImportPresentationStyles(NewFile):
         assert props.styles[0].name == "Name"
         assert props.styles[0].total_elements == 0
 
+    def test_import_total_elements_using_a_style(self):
+        ifc = ifcopenshell.file()
+        tool.Ifc.set(ifc)
+        element = ifcopenshell.api.run("root.create_entity", ifc, ifc_class="IfcWall")
+        style = ifc.createIfcSurfaceStyle(Name="Name")
+        ifc.createIfcSurfaceStyle(Name="Unused")
+        item = ifc.createIfcExtrudedAreaSolid()
+        ifc.createIfcStyledItem(Item=item, Styles=[style])
+        element.Representation = ifc.createIfcProductDefinitionShape(
+            Representations=[ifc.createIfcShapeRepresentation(Items=[item])]
+        )
+        subject.import_presentation_styles("IfcSurfaceStyle")
+        props = bpy.context.scene.BIMStylesProperties
+        assert props.styles[0].name == "Name"
+        assert props.styles[0].total_elements == 1
+        assert props.styles[1].name == "Unused"
+        assert props.styles[1].total_elements == 0
+
+    def test_import_total_elements_of_a_non_surface_style_type(self):
+        ifc = ifcopenshell.file()
+        tool.Ifc.set(ifc)
+        wall = ifcopenshell.api.run("root.create_entity", ifc, ifc_class="IfcWall")
+        surface_style = ifc.createIfcSurfaceStyle(Name="Surface")
+        surface_item = ifc.createIfcExtrudedAreaSolid()
+        ifc.createIfcStyledItem(Item=surface_item, Styles=[surface_style])
+        wall.Representation = ifc.createIfcProductDefinitionShape(
+            Representations=[ifc.createIfcShapeRepresentation(Items=[surface_item])]
+        )
+        annotation = ifcopenshell.api.run("root.create_entity", ifc, ifc_class="IfcAnnotation")
+        curve_style = ifc.createIfcCurveStyle(Name="Curve")
+        curve_item = ifc.createIfcPolyline()
+        ifc.createIfcStyledItem(Item=curve_item, Styles=[curve_style])
+        annotation.Representation = ifc.createIfcProductDefinitionShape(
+            Representations=[ifc.createIfcShapeRepresentation(Items=[curve_item])]
+        )
+        subject.import_presentation_styles("IfcCurveStyle")
+        props = bpy.context.scene.BIMStylesProperties
+        assert len(props.styles) == 1
+        assert props.styles[0].ifc_definition_id == curve_style.id()
+        assert props.styles[0].total_elements == 1
+
 
 class TestIsEditingStyles(NewFile):
     def test_run(self):
@@ -16,10 +16,15 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
 
+import math
 import ifcopenshell
 import ifcopenshell.api.pset
 from typing import Optional, Any
 
+# IFC2X3 pset property types, keyed by property name
+_CRS_PROPERTY_TYPES = {"Description": "IfcText", "Name": "IfcLabel"}
+_MAP_CONVERSION_REAL_PROPERTIES = frozenset(("XAxisAbscissa", "XAxisOrdinate", "Scale"))
+
 
 def edit_georeferencing(
     file: ifcopenshell.file,
@@ -78,36 +83,72 @@ def edit_georeferencing(
                 "Scale": 0.99956, # Ask your surveyor for your site's average combined scale factor!
             })
     """
+    if not coordinate_operation and not projected_crs:
+        return
     if file.schema == "IFC2X3":
-        if not (project := file.by_type("IfcProject")):
-            return
-        project = project[0]
-        if projected_crs:
-            if crs := ifcopenshell.util.element.get_pset(project, "ePSet_ProjectedCRS"):
-                crs = file.by_id(crs["id"])
-                for k, v in projected_crs.items():
-                    if k == "Description":
-                        v = file.createIfcText(v)
-                    elif k == "Name":
-                        v = file.createIfcLabel(v)
-                    else:
-                        v = file.createIfcIdentifier(v)
-                ifcopenshell.api.pset.edit_pset(file, crs, properties=projected_crs)
-        if coordinate_operation:
-            if conversion := ifcopenshell.util.element.get_pset(project, "ePSet_MapConversion"):
-                conversion = file.by_id(conversion["id"])
-                for k, v in coordinate_operation.items():
-                    if k in ("XAxisAbscissa", "XAxisOrdinate", "Scale"):
-                        v = file.createIfcReal(v)
-                    else:
-                        v = file.createIfcLengthMeasure(v)
-                ifcopenshell.api.pset.edit_pset(file, conversion, properties=coordinate_operation)
+        _edit_georeferencing_ifc2x3(file, coordinate_operation, projected_crs)
+    else:
+        _edit_georeferencing_ifc4(file, coordinate_operation, projected_crs)
+
+
+def _edit_georeferencing_ifc2x3(
+    file: ifcopenshell.file,
+    coordinate_operation: Optional[dict[str, Any]],
+    projected_crs: Optional[dict[str, Any]],
+) -> None:
+    # IFC2X3 stores georeferencing in project psets
+    if not (project := file.by_type("IfcProject")):
         return
+    psets = _get_psets_by_name(project[0], ("ePSet_ProjectedCRS", "ePSet_MapConversion"))
+    if projected_crs:
+        if crs := psets.get("ePSet_ProjectedCRS"):
+            properties = {
+                k: file.create_entity(_CRS_PROPERTY_TYPES.get(k, "IfcIdentifier"), v) for k, v in projected_crs.items()
+            }
+            ifcopenshell.api.pset.edit_pset(file, crs, properties=properties)
+    if coordinate_operation:
+        if conversion := psets.get("ePSet_MapConversion"):
+            properties = {
+                k: file.create_entity("IfcReal" if k in _MAP_CONVERSION_REAL_PROPERTIES else "IfcLengthMeasure", v)
+                for k, v in coordinate_operation.items()
+            }
+            ifcopenshell.api.pset.edit_pset(file, conversion, properties=properties)
+
+
+def _get_psets_by_name(
+    element: ifcopenshell.entity_instance, names: tuple[str, ...]
+) -> dict[str, ifcopenshell.entity_instance]:
+    # A single pass over the relationships, without building property dicts
+    psets = {}
+    for rel in element.IsDefinedBy:
+        if not rel.is_a("IfcRelDefinesByProperties"):
+            continue
+        definition = rel.RelatingPropertyDefinition
+        if definition.Name in names and definition.Name not in psets:
+            psets[definition.Name] = definition
+            if len(psets) == len(names):
+                break
+    return psets
+
+
+def _edit_georeferencing_ifc4(
+    file: ifcopenshell.file,
+    coordinate_operation: Optional[dict[str, Any]],
+    projected_crs: Optional[dict[str, Any]],
+) -> None:
     if projected_crs:
-        crs = file.by_type("IfcProjectedCRS")[0]
-        for name, value in projected_crs.items():
-            setattr(crs, name, value)
+        _set_changed_attributes(file.by_type("IfcProjectedCRS")[0], projected_crs)
     if coordinate_operation:
-        conversion = file.by_type("IfcCoordinateOperation")[0]
-        for name, value in coordinate_operation.items():
-            setattr(conversion, name, value)
+        _set_changed_attributes(file.by_type("IfcCoordinateOperation")[0], coordinate_operation)
+
+
+def _set_changed_attributes(element: ifcopenshell.entity_instance, attributes: dict[str, Any]) -> None:
+    # UI bindings tend to send every attribute, so skip writes that change nothing
+    for name, value in attributes.items():
+        current = getattr(element, name)
+        if isinstance(value, float) and isinstance(current, float):
+            if math.isclose(current, value, rel_tol=1e-12, abs_tol=0.0):
+                continue
+        elif current == value:
+            continue
+        setattr(element, name, value)
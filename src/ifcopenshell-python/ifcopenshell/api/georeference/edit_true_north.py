@@ -50,26 +50,36 @@ def edit_true_north(file: ifcopenshell.file, true_north: Optional[Union[tuple[fl
         # This unsets true north
         ifcopenshell.api.georeference.edit_true_north(model, true_north=None)
     """
-    if isinstance(true_north, (float, int)):
-        x, y = ifcopenshell.util.geolocation.angle2yaxis(true_north)
-    elif true_north is not None:
-        x, y = true_north
+    contexts = file.by_type("IfcGeometricRepresentationContext", include_subtypes=False)
 
-    for context in file.by_type("IfcGeometricRepresentationContext", include_subtypes=False):
-        if context.TrueNorth and true_north is None:
-            old_true_north =  context.TrueNorth
+    if true_north is None:
+        for context in contexts:
+            if not (old_true_north := context.TrueNorth):
+                continue
             context.TrueNorth = None
             if not file.get_total_inverses(old_true_north):
                 ifcopenshell.util.element.remove_deep2(file, old_true_north)
+        return
+
+    if isinstance(true_north, (float, int)):
+        x, y = ifcopenshell.util.geolocation.angle2yaxis(true_north)
+    else:
+        x, y = true_north
+    ratios_2d = (x, y)
+    ratios_3d = (x, y, 0.0)
+
+    new_directions = {}
+    for context in contexts:
+        direction_ratios = ratios_2d if context.CoordinateSpaceDimension == 2 else ratios_3d
+
+        if context.TrueNorth and file.get_total_inverses(context.TrueNorth) == 1:
+            # Only used by this context, so it is safe to edit in place
+            if context.TrueNorth.DirectionRatios != direction_ratios:
+                context.TrueNorth.DirectionRatios = direction_ratios
             continue
 
-        if context.TrueNorth:
-            if file.get_total_inverses(context.TrueNorth) != 1:
-                context.TrueNorth = file.create_entity("IfcDirection")
-        else:
-            context.TrueNorth = file.create_entity("IfcDirection")
-        direction = context.TrueNorth
-        if context.CoordinateSpaceDimension == 2:
-            direction.DirectionRatios = (x, y)
-        else:
-            direction.DirectionRatios = (x, y, 0.0)
+        # Contexts with the same dimension can share a single new direction
+        if not (direction := new_directions.get(context.CoordinateSpaceDimension)):
+            direction = file.create_entity("IfcDirection", DirectionRatios=direction_ratios)
+            new_directions[context.CoordinateSpaceDimension] = direction
+        context.TrueNorth = direction
@@ -44,6 +44,60 @@ class TestEditGeoreferencing(test.bootstrap.IFC4):
         ifcopenshell.api.georeference.edit_georeferencing(self.file, coordinate_operation={"Eastings": 42})
         assert conversion.Eastings == 42
 
+    def test_editing_the_same_projected_crs_with_or_without_a_coordinate_operation(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        ifcopenshell.api.context.add_context(self.file, "Model")
+        ifcopenshell.api.georeference.add_georeferencing(self.file)
+        crs = self.file.by_type("IfcProjectedCRS")[0]
+        crs.Name = "EPSG:7856"
+        other_crs = self.file.createIfcProjectedCRS(Name="EPSG:7855")
+        conversion = self.file.by_type("IfcMapConversion")[0]
+        conversion.TargetCRS = other_crs
+        ifcopenshell.api.georeference.edit_georeferencing(self.file, projected_crs={"Name": "EPSG:1234"})
+        assert crs.Name == "EPSG:1234"
+        ifcopenshell.api.georeference.edit_georeferencing(
+            self.file, projected_crs={"Name": "EPSG:4321"}, coordinate_operation={"Eastings": 42}
+        )
+        assert crs.Name == "EPSG:4321"
+        assert other_crs.Name == "EPSG:7855"
+        assert conversion.Eastings == 42
+
+    def test_not_writing_unchanged_attributes(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        ifcopenshell.api.context.add_context(self.file, "Model")
+        ifcopenshell.api.georeference.add_georeferencing(self.file)
+        ifcopenshell.api.georeference.edit_georeferencing(
+            self.file,
+            projected_crs={"Name": "EPSG:7856"},
+            coordinate_operation={"Eastings": 123.45, "Scale": 0.99956},
+        )
+        crs = self.file.by_type("IfcProjectedCRS")[0]
+        conversion = self.file.by_type("IfcMapConversion")[0]
+        self.file.begin_transaction()
+        ifcopenshell.api.georeference.edit_georeferencing(
+            self.file,
+            projected_crs={"Name": "EPSG:7856"},
+            coordinate_operation={
+                "Eastings": 123.45 * (1 + 1e-15),
+                "Scale": 0.99956,
+                "TargetCRS": crs,
+            },
+        )
+        assert self.file.transaction.operations == []
+        self.file.end_transaction()
+
+    def test_writing_changed_float_attributes(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        ifcopenshell.api.context.add_context(self.file, "Model")
+        ifcopenshell.api.georeference.add_georeferencing(self.file)
+        ifcopenshell.api.georeference.edit_georeferencing(self.file, coordinate_operation={"Scale": 0.99956})
+        conversion = self.file.by_type("IfcMapConversion")[0]
+        self.file.begin_transaction()
+        ifcopenshell.api.georeference.edit_georeferencing(self.file, coordinate_operation={"Scale": 0.99957})
+        assert self.file.transaction.operations
+        self.file.end_transaction()
+        assert conversion.Scale == 0.99957
+
 
 class TestEditGeoreferencingIFC2X3(test.bootstrap.IFC2X3):
     def test_editing_georeferencing(self):
@@ -62,3 +116,20 @@ class TestEditGeoreferencingIFC2X3(test.bootstrap.IFC2X3):
         assert self.file.by_id(conversion["Eastings"]["id"]).NominalValue.is_a("IfcLengthMeasure")
         assert conversion["Northings"]["value"] == 234.56
         assert conversion["OrthogonalHeight"]["value"] == 0
+
+    def test_editing_georeferencing_with_the_correct_data_types(self):
+        project = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        ifcopenshell.api.georeference.add_georeferencing(self.file)
+        ifcopenshell.api.georeference.edit_georeferencing(
+            self.file,
+            projected_crs={"Description": "Description", "GeodeticDatum": "GDA2020"},
+            coordinate_operation={"Scale": 1, "XAxisAbscissa": 1, "Eastings": 42},
+        )
+        conversion = ifcopenshell.util.element.get_pset(project, "ePSet_MapConversion", verbose=True)
+        crs = ifcopenshell.util.element.get_pset(project, "ePSet_ProjectedCRS", verbose=True)
+        assert self.file.by_id(crs["Description"]["id"]).NominalValue.is_a("IfcText")
+        assert self.file.by_id(crs["GeodeticDatum"]["id"]).NominalValue.is_a("IfcIdentifier")
+        assert self.file.by_id(conversion["Scale"]["id"]).NominalValue.is_a("IfcReal")
+        assert self.file.by_id(conversion["XAxisAbscissa"]["id"]).NominalValue.is_a("IfcReal")
+        assert self.file.by_id(conversion["Eastings"]["id"]).NominalValue.is_a("IfcLengthMeasure")
+        assert conversion["Eastings"]["value"] == 42
@@ -36,3 +36,34 @@ class TestEditTrueNorth(test.bootstrap.IFC4):
         assert np.isclose(ifcopenshell.util.geolocation.get_true_north(self.file), 30)
         ifcopenshell.api.georeference.edit_true_north(self.file, true_north=30)
         assert np.isclose(ifcopenshell.util.geolocation.get_true_north(self.file), 30)
+
+    def test_contexts_of_the_same_dimension_share_a_new_true_north(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        model = ifcopenshell.api.context.add_context(self.file, "Model")
+        model2 = ifcopenshell.api.context.add_context(self.file, "Model")
+        plan = ifcopenshell.api.context.add_context(self.file, "Plan")
+        total_directions = len(self.file.by_type("IfcDirection"))
+        ifcopenshell.api.georeference.edit_true_north(self.file, true_north=[0.0, 1.0])
+        assert model.TrueNorth == model2.TrueNorth
+        assert model.TrueNorth != plan.TrueNorth
+        assert len(self.file.by_type("IfcDirection")) == total_directions + 2
+
+    def test_editing_a_shared_true_north_does_not_affect_other_users(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        model = ifcopenshell.api.context.add_context(self.file, "Model")
+        direction = self.file.createIfcDirection((0.0, 1.0, 0.0))
+        model.TrueNorth = direction
+        placement = self.file.createIfcAxis2Placement3D(Axis=direction)
+        ifcopenshell.api.georeference.edit_true_north(self.file, true_north=[-0.5, 0.8660254])
+        assert placement.Axis.DirectionRatios == (0.0, 1.0, 0.0)
+        assert model.TrueNorth.DirectionRatios == (-0.5, 0.8660254, 0.0)
+
+    def test_unsetting_true_north(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        model = ifcopenshell.api.context.add_context(self.file, "Model")
+        plan = ifcopenshell.api.context.add_context(self.file, "Plan")
+        ifcopenshell.api.georeference.edit_true_north(self.file, true_north=[0.0, 1.0])
+        plan.TrueNorth = None
+        ifcopenshell.api.georeference.edit_true_north(self.file, true_north=None)
+        assert model.TrueNorth is None
+        assert plan.TrueNorth is None